@@ -43,26 +43,41 @@ fname = download_file(
 )
 
 # The following commands load the FITS file and calculate the RA and DEC axes using information from the FITS header. For more information on reading FITS files in Python, please consult the [astropy documentation](https://docs.astropy.org/en/stable/io/fits/index.html).
-
-hdul = fits.open(fname)
-hdu = hdul[0]
-clean_img = np.squeeze(hdu.data)
-header = hdu.header
-hdul.close()
+#
+# The FITS image is 3000x3000 pixels, but we'll only be looking at the central arcsecond or so around the disk. So rather than reading the full image into memory with `hdu.data`, we'll open the file memory-mapped and read only the window of pixels that we'll plot, using [hdu.section](https://docs.astropy.org/en/stable/io/fits/usage/image.html#data-sections).
 
 # +
-# get the number of pixels in each direction
-nx = header["NAXIS1"]
-ny = header["NAXIS2"]
-# RA coordinates
-CDELT1 = 3600 * header["CDELT1"]  # Convert from units of degrees to arcsec
+# zooming in a little to focus on the disk
+r_clean = 0.8  # [arcsec] half-width of the CLEAN image region
+
+with fits.open(fname, memmap=True) as hdul:
+    hdu = hdul[0]
+    header = hdu.header
+
+    # get the number of pixels in each direction
+    nx = header["NAXIS1"]
+    ny = header["NAXIS2"]
+    # RA coordinates
+    CDELT1 = 3600 * header["CDELT1"]  # Convert from units of degrees to arcsec
+
+    # DEC coordinates
+    CDELT2 = 3600 * header["CDELT2"]  # [arcsec]
 
-# DEC coordinates
-CDELT2 = 3600 * header["CDELT2"]  # [arcsec]
+    # calculate the RA and DEC pixel centers
+    RA = (np.arange(nx) - nx / 2) * CDELT1  # [arcsec]
+    DEC = (np.arange(ny) - ny / 2) * CDELT2  # [arcsec]
 
-# calculate the RA and DEC pixel centers
-RA = (np.arange(nx) - nx / 2) * CDELT1  # [arcsec]
-DEC = (np.arange(ny) - ny / 2) * CDELT2  # [arcsec]
+    # find the pixels within the window (with a pixel to spare on each side)
+    iRA = np.flatnonzero(np.abs(RA) <= r_clean + np.abs(CDELT1))
+    iDEC = np.flatnonzero(np.abs(DEC) <= r_clean + np.abs(CDELT2))
+    RA_window = slice(iRA[0], iRA[-1] + 1)
+    DEC_window = slice(iDEC[0], iDEC[-1] + 1)
+
+    # read only these pixels from disk
+    clean_img = np.squeeze(hdu.section[..., DEC_window, RA_window])
+
+RA = RA[RA_window]
+DEC = DEC[DEC_window]
 
 # matplotlib imshow extent needs to include extra half-pixels.
 ext = (
@@ -76,10 +91,8 @@ ext = (
 # Here is the CLEAN image produced by the DSHARP team ([Andrews et al. 2018](https://ui.adsabs.harvard.edu/abs/2018ApJ...869L..41A/abstract)).
 
 plt.imshow(clean_img, origin="lower", extent=ext)
-# zooming in a little to focus on the disk
-r = 0.8
-plt.xlim(left=r, right=-r)
-plt.ylim(top=r, bottom=-r)
+plt.xlim(left=r_clean, right=-r_clean)
+plt.ylim(top=r_clean, bottom=-r_clean)
 # axis labels
 plt.xlabel(r"$\Delta \alpha \cos \delta$ [${}^{\prime\prime}$]")
 plt.ylabel(r"$\Delta \delta$ [${}^{\prime\prime}$]")
@@ -103,15 +116,30 @@ vv = d["vv"]
 weight = d["weight"]
 data = d["data"]
 
-# To get an idea of the $u,v$ coverage of the dataset, let's plot the $u,v$ coordinates of the visibilities, as we've done in the [cross-validation tutorial](https://mpol-dev.github.io/MPoL/ci-tutorials/crossvalidation.html) and the [visread documentation](https://mpol-dev.github.io/visread/tutorials/introduction_to_casatools.html#Get-the-baselines).
+# To get an idea of the $u,v$ coverage of the dataset, let's plot the $u,v$ coordinates of the visibilities, as we've done in the [cross-validation tutorial](https://mpol-dev.github.io/MPoL/ci-tutorials/crossvalidation.html) and the [visread documentation](https://mpol-dev.github.io/visread/tutorials/introduction_to_casatools.html#Get-the-baselines). Because there are so many visibilities, rather than drawing every point with a scatter plot, we'll bin the baselines (and their complex conjugates) into a 2D histogram and display the number of visibilities in each bin on a log scale.
+
+# +
+qmax = max(np.max(np.abs(uu)), np.max(np.abs(vv)))  # [klambda]
+edges = np.linspace(-qmax, qmax, 513)
+counts, _, _ = np.histogram2d(vv, uu, bins=edges)
+
+# the bins are symmetric about the origin, so the complex conjugates at (-u, -v)
+# land in the point-reflected bins and we can add them without negating uu and vv
+counts += counts[::-1, ::-1]
 
 fig, ax = plt.subplots(nrows=1)
-ax.scatter(uu, vv, s=0.5, rasterized=True, linewidths=0.0, c="k")
-ax.scatter(-uu, -vv, s=0.5, rasterized=True, linewidths=0.0, c="k")
+ax.imshow(
+    np.log1p(counts),
+    origin="lower",
+    interpolation="none",
+    extent=(-qmax, qmax, -qmax, qmax),
+    cmap="Greys",
+)
 ax.set_xlabel(r"$u$ [k$\lambda$]")
 ax.set_ylabel(r"$v$ [k$\lambda$]")
 ax.set_aspect("equal")
 ax.set_title("Baselines")
+# -
 
 # As you can see, there is a very dense grouping of visibilities with $q < 2000\, \mathrm{k}\lambda$, where $q=\sqrt{u^2 + v^2}$, which primarily consists of data taken in more compact ALMA configurations. There are also several visibilities with baselines > 7,000 ($k\lambda$), which correspond to the extended ALMA configurations and is the reason why the DSHARP data can generate some of the highest spatial resolution images of protoplanetary disks to date.
 
@@ -152,19 +180,28 @@ gridder = gridding.Gridder(
 #
 # There are different ways to weight the visibilities during the averaging process to promote certain image characteristics. More info on the weighting can be found in the [CASA documentation](https://casa.nrao.edu/casadocs-devel/stable/imaging/synthesis-imaging/data-weighting). The MPoL gridder is capable of averaging visibilities using uniform, natural, and Briggs robust weighting. We'll demonstrate this functionality by making several different dirty images under different averaging schemes.
 
-# We'll write a function to calculate the dirty image and then plot it.
+# Each weighting needs its own averaging and inverse FFT, but much of the work of making a dirty image doesn't depend on the weighting: checking the scatter of the visibilities, and summing the (thermally weighted) visibilities within each cell. So rather than calling `get_dirty_image` once per weighting, we'll calculate all of the dirty images at once with [Gridder.get_dirty_images()](../api.rst#mpol.gridding.Gridder.get_dirty_images), which only does this shared work once, and then plot them one at a time.
+
+# +
+weightings = [("uniform", None), ("natural", None), ("briggs", -1.0), ("briggs", 0.0)]
+
+dirty_images = gridder.get_dirty_images(weightings, unit="Jy/arcsec^2")
+# the dataset is a single continuum channel, so take the first (and only) channel
+imgs = {key: img[0] for key, (img, beam) in zip(weightings, dirty_images)}
+# -
 
+# Next, we'll write a function to plot the dirty image for a given weighting. The plotting settings don't depend on the weighting, so we set them up once.
 
-def image_and_plot(weighting, robust=None):
+# +
+img_kw = {"origin": "lower", "extent": gridder.coords.img_ext}
+r = 0.7  # [arcsec] half-width of the plotted region
 
-    img, beam = gridder.get_dirty_image(
-        weighting=weighting, robust=robust, unit="Jy/arcsec^2"
-    )
 
-    kw = {"origin": "lower", "extent": gridder.coords.img_ext}
+def plot_image(weighting, robust=None):
+
     fig, ax = plt.subplots(ncols=1)
-    im = ax.imshow(np.squeeze(img), **kw)
-    cbar = plt.colorbar(im)
+    im = ax.imshow(imgs[(weighting, robust)], **img_kw)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label(r"$\mathrm{Jy}/\mathrm{arcsec}^2$")
 
     title = weighting
@@ -173,26 +210,25 @@ def image_and_plot(weighting, robust=None):
     ax.set_title(title)
     ax.set_xlabel(r"$\Delta \alpha \cos \delta$ [${}^{\prime\prime}$]")
     ax.set_ylabel(r"$\Delta \delta$ [${}^{\prime\prime}$]")
-    r = 0.7
-    plt.xlim(left=r, right=-r)
-    plt.ylim(bottom=-r, top=r)
+    ax.set_xlim(left=r, right=-r)
+    ax.set_ylim(bottom=-r, top=r)
 
-    return np.squeeze(img)
 
+# -
 
 # Uniform weighting frequently produces images with the best spatial resolution, but at the expense of sensitivity.
 
-_ = image_and_plot(weighting="uniform")
+plot_image(weighting="uniform")
 
 # Natural weighting frequently produces images with the best sensitivity to point sources, but at the expense of spatial resolution.
 
-_ = image_and_plot(weighting="natural")
+plot_image(weighting="natural")
 
 # Robust weigting provides a (nonlinear) tradeoff between these two regimes, and some form of robust weighting is typically chosen for ALMA imaging.
 
-_ = image_and_plot(weighting="briggs", robust=-1.0)
+plot_image(weighting="briggs", robust=-1.0)
 
-img_robust_0 = image_and_plot(weighting="briggs", robust=0.0)
+plot_image(weighting="briggs", robust=0.0)
 
 # ## Comparing Dirty and CLEANed Images
 #
@@ -206,11 +242,10 @@ fig, ax = plt.subplots(ncols=2, figsize=(5.5, 3))
 ax[0].imshow(clean_img, origin="lower", extent=ext)
 ax[0].set_title("DSHARP CLEAN")
 
-ax[1].imshow(img_robust_0, origin="lower", extent=gridder.coords.img_ext)
+ax[1].imshow(imgs[("briggs", 0.0)], **img_kw)
 ax[1].set_title("MPoL Dirty")
 
 for a in ax:
-    r = 0.7
     a.set_xlim(left=r, right=-r)
     a.set_ylim(bottom=-r, top=r)
 
@@ -32,7 +32,9 @@ EXTRA_REQUIRES = {
         "requests",
         "astropy",
         "tensorboard",
+        "finufft",
     ],
+    "nufft": ["finufft"],
     "docs": [
         "sphinx>=2.3.0",
         "numpy",
@@ -4,6 +4,23 @@ from numpy.fft import fftfreq, fftshift, ifft2, ifftshift, rfftfreq
 from .constants import arcsec
 from .utils import get_max_spatial_freq, get_maximum_cell_size
 
+# the npix x npix coordinate arrays of GridCoords, which are only calculated when
+# first accessed (many uses of GridCoords never need them)
+_GRID_COORDS_2D = [
+    "sky_u_centers_2D",
+    "sky_v_centers_2D",
+    "sky_q_centers_2D",
+    "sky_phi_centers_2D",
+    "packed_u_centers_2D",
+    "packed_v_centers_2D",
+    "packed_q_centers_2D",
+    "packed_phi_centers_2D",
+    "packed_x_centers_2D",
+    "packed_y_centers_2D",
+    "sky_y_centers_2D",
+    "sky_x_centers_2D",
+]
+
 
 class GridCoords:
     r"""
@@ -98,6 +115,31 @@ class GridCoords:
         # max u or v freq supported by current grid
         self.max_grid = get_max_spatial_freq(self.cell_size, self.npix)
 
+        # the largest q of the cell centers is in the corner of the grid
+        self.q_max = (
+            np.sqrt(
+                np.max(np.abs(self.u_centers)) ** 2
+                + np.max(np.abs(self.v_centers)) ** 2
+            )
+            + np.sqrt(2) * self.du
+        )  # outer edge [klambda]
+
+    def __getattr__(self, name):
+        # only called if ``name`` isn't already an attribute. The 2D coordinate
+        # arrays are calculated (and stored on the instance) when first accessed
+        if name not in _GRID_COORDS_2D:
+            raise AttributeError(
+                "'{:}' object has no attribute '{:}'".format(type(self).__name__, name)
+            )
+
+        self._calculate_centers_2D()
+        return self.__dict__[name]
+
+    def _calculate_centers_2D(self):
+        r"""
+        Calculate the 2D arrays of the :math:`u,v` and image-plane cell centers, and store them on the instance.
+        """
+
         # only useful for plotting a sky_vis... uu, vv increasing, no fftshift
         self.sky_u_centers_2D, self.sky_v_centers_2D = np.meshgrid(
             self.u_centers, self.v_centers, indexing="xy"
@@ -121,10 +163,6 @@ class GridCoords:
         self.packed_q_centers_2D = np.fft.fftshift(self.sky_q_centers_2D)
         self.packed_phi_centers_2D = np.fft.fftshift(self.sky_phi_centers_2D)
 
-        self.q_max = (
-            np.max(np.abs(self.packed_q_centers_2D)) + np.sqrt(2) * self.du
-        )  # outer edge [klambda]
-
         # x_centers_2D and y_centers_2D are just l and m in units of arcsec
         x_centers_2D, y_centers_2D = np.meshgrid(
             self.l_centers / arcsec, self.m_centers / arcsec, indexing="xy"
@@ -94,25 +94,42 @@ class GriddedDataset:
         """
         return utils.packed_cube_to_ground_cube(self.mask)
 
-    def to(self, device):
+    def pin_memory(self):
+        """
+        Copies the tensors of the dataset into page-locked (pinned) host memory. Copies from pinned memory to a CUDA device can be made asynchronously with ``to(device, non_blocking=True)``, so that the transfer overlaps with other work (e.g., setting up the model) rather than blocking until it is complete. Requires CUDA.
+
+        Returns:
+            the GriddedDataset instance with its tensors in pinned memory
+        """
+        self.vis_gridded = self.vis_gridded.pin_memory()
+        self.weight_gridded = self.weight_gridded.pin_memory()
+        self.mask = self.mask.pin_memory()
+
+        self.vis_indexed = self.vis_indexed.pin_memory()
+        self.weight_indexed = self.weight_indexed.pin_memory()
+
+        return self
+
+    def to(self, device, non_blocking=False):
         """
         Moves the tensors of the dataset to specified device.
 
         Args:
             device (torch.device): the desired device
+            non_blocking (bool): if ``True`` and the tensors are in pinned memory (see :meth:`~mpol.datasets.GriddedDataset.pin_memory`), copy them to the device asynchronously with respect to the host.
 
         Returns:
             copy of the GriddedDataset instance on the new device
         """
-        self.vis_gridded = self.vis_gridded.to(device)
-        self.weight_gridded = self.weight_gridded.to(device)
-        self.mask = self.mask.to(device)
+        self.vis_gridded = self.vis_gridded.to(device, non_blocking=non_blocking)
+        self.weight_gridded = self.weight_gridded.to(device, non_blocking=non_blocking)
+        self.mask = self.mask.to(device, non_blocking=non_blocking)
 
         # pre-index the values
         # note that these are *collapsed* across all channels
         # 1D array
-        self.vis_indexed = self.vis_indexed.to(device)
-        self.weight_indexed = self.weight_indexed.to(device)
+        self.vis_indexed = self.vis_indexed.to(device, non_blocking=non_blocking)
+        self.weight_indexed = self.weight_indexed.to(device, non_blocking=non_blocking)
 
         return self
 
@@ -1,6 +1,9 @@
 import warnings
 
 import numpy as np
+import torch
+import torch.fft  # to avoid conflicts with old torch.fft *function*
+from scipy.fft import irfft2
 
 from .coordinates import _setup_coords
 from .datasets import GriddedDataset
@@ -49,7 +52,7 @@ class Gridder:
     r"""
     The Gridder object uses desired image dimensions (via the ``cell_size`` and ``npix`` arguments) to define a corresponding Fourier plane grid as a :class:`.GridCoords` object. A pre-computed :class:`.GridCoords` can be supplied in lieu of ``cell_size`` and ``npix``, but all three arguments should never be supplied at once. For more details on the properties of the grid that is created, see the :class:`.GridCoords` documentation.
 
-    The :class:`.Gridder` object accepts "loose" *ungridded* visibility data and stores the arrays to the object as instance attributes. The input visibility data should be the set of visibilities over the full :math:`[-u,u]` and :math:`[-v,v]` domain, the Gridder will automatically augment the dataset to include the complex conjugates. The visibilities can be 1d for a single continuum channel, or 2d for image cube. If 1d, visibilities will be converted to 2d arrays of shape ``(1, nvis)``. Like the :class:`~mpol.images.ImageCube` class, after construction, the Gridder assumes that you are operating with a multi-channel set of visibilities. These routines will still work with single-channel 'continuum' visibilities, they will just have nchan = 1 in the first dimension of most products.
+    The :class:`.Gridder` object accepts "loose" *ungridded* visibility data and stores the arrays to the object as instance attributes. The input visibility data should be the set of visibilities over the full :math:`[-u,u]` and :math:`[-v,v]` domain, the Gridder will automatically augment the dataset to include the complex conjugates. The stored visibilities are also sorted by the :math:`u,v` cell they fall in, so their order will generally differ from the input order. The visibilities can be 1d for a single continuum channel, or 2d for image cube. If 1d, visibilities will be converted to 2d arrays of shape ``(1, nvis)``. Like the :class:`~mpol.images.ImageCube` class, after construction, the Gridder assumes that you are operating with a multi-channel set of visibilities. These routines will still work with single-channel 'continuum' visibilities, they will just have nchan = 1 in the first dimension of most products.
 
     If your goal is to use these gridded visibilities in Regularized Maximum Likelihood imaging, you can export them to the appropriate PyTorch object using the :func:`~mpol.gridding.Gridder.to_pytorch_dataset` routine.
 
@@ -88,33 +91,80 @@ class Gridder:
         nchan = len(uu)
         _setup_coords(self, cell_size, npix, coords, nchan)
 
-        # expand the vectors to include complex conjugates
-        uu_full = np.concatenate([uu, -uu], axis=1)
-        vv_full = np.concatenate([vv, -vv], axis=1)
+        # make sure we fit into the grid. Since the check is on the absolute values of
+        # the spatial frequencies, this covers the complex conjugates as well
+        self.coords.check_data_fit(uu, vv)
 
-        # make sure we still fit into the grid
-        self.coords.check_data_fit(uu_full, vv_full)
-
-        self.uu = uu_full
-        self.vv = vv_full
-        self.weight = np.concatenate([weight, weight], axis=1)
-        self.data_re = np.concatenate([data_re, data_re], axis=1)
-        self.data_im = np.concatenate([data_im, -data_im], axis=1)
+        # carry out the dirty image FFTs at the precision of the input visibilities,
+        # i.e., complex64 for single precision data and complex128 for double
+        self._fft_dtype = np.result_type(data_re, data_im, np.complex64)
 
         # figure out which visibility cell each datapoint lands in, so that
         # we can later assign it the appropriate robust weight for that cell
-        # do this by calculating the nearest cell index [0, N] for all samples
-        self.index_u = np.array(
-            [np.digitize(u_chan, self.coords.u_edges) - 1 for u_chan in self.uu]
+        # do this by calculating the nearest cell index [0, N] for all samples.
+        # The cell of the complex conjugate at -u is found by digitizing u against
+        # the negated (reversed) edges, which gives the identical index without
+        # allocating the negated coordinates.
+        u_edges = self.coords.u_edges
+        v_edges = self.coords.v_edges
+        index_u = np.concatenate(
+            [
+                np.digitize(uu, u_edges) - 1,
+                len(u_edges) - 1 - np.digitize(uu, -u_edges[::-1], right=True),
+            ],
+            axis=1,
+        )
+        index_v = np.concatenate(
+            [
+                np.digitize(vv, v_edges) - 1,
+                len(v_edges) - 1 - np.digitize(vv, -v_edges[::-1], right=True),
+            ],
+            axis=1,
         )
 
-        self.index_v = np.array(
-            [np.digitize(v_chan, self.coords.v_edges) - 1 for v_chan in self.vv]
+        # flatten the channel and 2D cell index into a single (row-major) index of the
+        # ``(nchan, ncell_v, ncell_u)`` cube, so that summing values into cells
+        # is a single np.bincount call across all channels
+        ncell = self.coords.ncell_v * self.coords.ncell_u
+        index_cell = (
+            np.arange(self.nchan)[:, np.newaxis] * ncell
+            + index_v * self.coords.ncell_u
+            + index_u
         )
 
-    def _sum_cell_values_channel(self, uu, vv, values=None):
+        # sort the visibilities within each channel by the cell they fall in,
+        # so that summing into (and extracting from) the cells reads and writes
+        # the grid sequentially, rather than at random
+        order = np.argsort(index_cell, axis=1, kind="stable")
+        self.index_cell = np.take_along_axis(index_cell, order, axis=1)
+        del index_cell
+        self.index_u = np.take_along_axis(index_u, order, axis=1)
+        del index_u
+        self.index_v = np.take_along_axis(index_v, order, axis=1)
+        del index_v
+
+        # expand the vectors to include complex conjugates. The first nvis entries of
+        # the ordering are the visibilities themselves and the last nvis are their
+        # conjugates, so gather each input straight into its sorted position and
+        # then flip the sign of u, v, and the imaginary part of the conjugates in place
+        nvis = uu.shape[1]
+        conjugate = order >= nvis
+        source = np.remainder(order, nvis, out=order)
+
+        self.uu = np.take_along_axis(uu, source, axis=1)
+        self.vv = np.take_along_axis(vv, source, axis=1)
+        self.weight = np.take_along_axis(weight, source, axis=1)
+        self.data_re = np.take_along_axis(data_re, source, axis=1)
+        self.data_im = np.take_along_axis(data_im, source, axis=1)
+        for a in [self.uu, self.vv, self.data_im]:
+            np.negative(a, out=a, where=conjugate)
+
+        # remember which of the visibilities are the complex conjugates
+        self._conjugate = conjugate
+
+    def _sum_cell_values_cube(self, values=None):
         r"""
-        Given a list of loose visibility points :math:`(u,v)` and their corresponding values :math:`x`,
+        Given the loose visibility points :math:`(u,v)` and their corresponding values :math:`x`,
         partition the points up into 2D :math:`u-v` cells defined by the ``coords`` object attached to
         the gridder, such that ``cell[i,j]`` has bounds between ``coords.u_edges[j, j+1]`` and ``coords.v_edges[i, i+1]``.
         Then, sum the corresponding values for each :math:`(u,v)` point that falls within each cell. The resulting
@@ -126,51 +176,44 @@ class Gridder:
 
         where :math:`k` indexes all :math:`(u,v)` points that fall within ``coords.u_edges[j, j+1]`` and ``coords.v_edges[i, i+1]``. In the case that all values are :math:`1`, the result is the number of visibilities within each cell (i.e., a histogram).
 
+        All channels are summed at once, using the flattened cube indices in ``self.index_cell``.
+
         Args:
-            uu (np.array): 1D array of East-West spatial frequency coordinates for a specific channel. Units of [:math:`\mathrm{k}\lambda`]
-            vv (np.array): 1D array of North-South spatial frequency coordinates for a specific channel. Units of [:math:`\mathrm{k}\lambda`]
-            values (np.array): 1D array of values (the same length as uu and vv) to use in the sum over each cell. The default (``values=None``) corresponds to using ``values=np.ones_like(uu)`` such that the routine is equivalent to a histogram.
+            values (np.array): ``(nchan, nvis)`` array of values to use in the sum over each cell. The default (``values=None``) corresponds to using ``values=np.ones_like(uu)`` such that the routine is equivalent to a histogram.
 
         Returns:
-            A 2D array of size ``(npix, npix)`` in ground format containing the summed cell quantities.
+            A 3D array of size ``(nchan, npix, npix)`` in ground format containing the summed cell quantities.
+
         """
+        shape = (self.nchan, self.coords.ncell_v, self.coords.ncell_u)
 
-        result = np.histogram2d(
-            vv,
-            uu,
-            bins=[self.coords.v_edges, self.coords.u_edges],
-            weights=values,
+        if values is not None:
+            values = np.ravel(values)
+
+        cube = np.bincount(
+            self.index_cell.ravel(), weights=values, minlength=np.prod(shape)
         )
 
-        # only return the "H" value
-        return result[0]
+        return cube.reshape(shape).astype("float", copy=False)
 
-    def _sum_cell_values_cube(self, values=None):
+    def _sum_weighted_cell_values(self):
         r"""
-        Perform the :func:`~mpol.gridding.Gridder.sum_cell_values_channel` routine over all channels of the
-        input visibilities.
-
-        Args:
-            values (iterable): ``(nchan, nvis)`` array of values to use in the sum over each cell. The default (``values=None``) corresponds to using ``values=np.ones_like(uu)`` such that the routine is equivalent to a histogram.
+        Sum the thermal weights, and the real and imaginary visibilities multiplied by their thermal weights, within each :math:`u,v` cell. These sums don't depend on the choice of weighting, and (without a taper) the gridded visibilities for any weighting are these sums times the density weight of each cell.
 
         Returns:
-            A 3D array of size ``(nchan, npix, npix)`` in ground format containing the summed cell quantities.
-
+            3-tuple of ``(cell_weight, cell_data_re, cell_data_im)``, each a ``(nchan, ncell_v, ncell_u)`` array in ground format.
         """
-        # calculate the histogrammed result for all channels
-        cube = np.empty(
-            (self.nchan, self.coords.ncell_v, self.coords.ncell_u),
-            dtype="float",
-        )
-
-        if values is None:
-            # pass None to every channel
-            values = [None] * self.nchan
 
-        for i in range(self.nchan):
-            cube[i] = self._sum_cell_values_channel(self.uu[i], self.vv[i], values[i])
+        # form the products at the (double) precision that the cell sums accumulate in
+        cell_weight = self._sum_cell_values_cube(self.weight)
+        cell_data_re = self._sum_cell_values_cube(
+            np.multiply(self.data_re, self.weight, dtype=np.float64)
+        )
+        cell_data_im = self._sum_cell_values_cube(
+            np.multiply(self.data_im, self.weight, dtype=np.float64)
+        )
 
-        return cube
+        return cell_weight, cell_data_re, cell_data_im
 
     def _extract_gridded_values_to_loose(self, gridded_quantity):
         r"""
@@ -183,52 +226,23 @@ class Gridder:
             A ``(nchan, nvis)`` array of values corresponding to the loose visibilities, using the quantity in that cell.
         """
 
-        return np.array(
-            [
-                gridded_quantity[i][self.index_v[i], self.index_u[i]]
-                for i in range(self.nchan)
-            ]
-        )
+        return np.take(gridded_quantity, self.index_cell)
 
-    def _grid_visibilities(
-        self,
-        weighting="uniform",
-        robust=None,
-        taper_function=None,
-    ):
+    def _check_weighting(self, weighting="uniform", robust=None):
         r"""
-        Grid the loose data visibilities to the Fourier grid in preparation for imaging.
+        Check that the choice of ``weighting`` and ``robust`` is valid, raising a ``ValueError`` (or an ``AssertionError`` for an out of range ``robust`` value) if it isn't.
 
         Args:
             weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
-            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2]. ``robust=-2`` approxmately corresponds to uniform weighting and ``robust=2`` approximately corresponds to natural weighting.
-            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. The function must assume that :math:`u` and :math:`v` will be supplied in units of :math:`\mathrm{k}\lambda`. By default no taper is applied.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2].
         """
 
-        if taper_function is None:
-            tapering_weight = np.ones_like(self.weight)
-        else:
-            tapering_weight = taper_function(self.uu, self.vv)
-
-        # create the cells as edges around the existing points
-        # note that at this stage, the UV grid is strictly increasing
-        # when in fact, later on, we'll need to fftshift for the FFT
-        cell_weight = self._sum_cell_values_cube(self.weight)
-
-        # boolean index for cells that *contain* visibilities
-        mask = cell_weight > 0.0
-
-        # calculate the density weights
-        # the density weights have the same shape as the re, im samples.
-        if weighting == "natural":
-            density_weight = np.ones_like(self.weight)
-        elif weighting == "uniform":
-            # cell_weight is (nchan, ncell_v, ncell_u)
-            # self.index_v, self.index_u are (nchan, nvis)
-            # we want density_weights to be (nchan, nvis)
-            density_weight = 1 / self._extract_gridded_values_to_loose(cell_weight)
+        if weighting not in ["natural", "uniform", "briggs"]:
+            raise ValueError(
+                "weighting must be specified as one of 'natural', 'uniform', or 'briggs'"
+            )
 
-        elif weighting == "briggs":
+        if weighting == "briggs":
             if robust is None:
                 raise ValueError(
                     "If 'briggs' weighting, a robust value must be specified between [-2, 2]."
@@ -237,50 +251,174 @@ class Gridder:
                 robust <= 2
             ), "robust parameter must be in the range [-2, 2]"
 
+    def _calculate_cell_density_weight(
+        self, cell_weight, weighting="uniform", robust=None
+    ):
+        r"""
+        Calculate the density weight for each :math:`u,v` cell. The density weight of a visibility only depends on the cell it falls in, so the weight of each visibility is its thermal weight times the density weight of its cell (and optionally a taper).
+
+        Args:
+            cell_weight (np.array): ``(nchan, ncell_v, ncell_u)`` array of the summed thermal weights in each cell, in ground format, i.e., ``self._sum_cell_values_cube(self.weight)``.
+            weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2]. ``robust=-2`` approxmately corresponds to uniform weighting and ``robust=2`` approximately corresponds to natural weighting.
+
+        Returns:
+            A ``(nchan, ncell_v, ncell_u)`` array of the density weight in each cell, which is zero for cells that have no visibilities, or ``None`` for natural weighting, where all of the density weights are 1.
+        """
+
+        self._check_weighting(weighting, robust)
+
+        if weighting == "natural":
+            # the density weights are all 1
+            return None
+        elif weighting == "uniform":
+            # the density weight is the inverse of the summed weight in the cell
+            # leave the cells that have no visibilities at zero
+            cell_density_weight = np.zeros_like(cell_weight)
+            np.divide(
+                1.0, cell_weight, out=cell_density_weight, where=cell_weight > 0.0
+            )
+            return cell_density_weight
+        else:
             # implement robust weighting using the definition used in CASA
             # https://casa.nrao.edu/casadocs-devel/stable/imaging/synthesis-imaging/data-weighting
 
             # calculate the robust parameter f^2 for each channel
+            # every visibility falls within a cell, so the total weight can be
+            # summed over the cells rather than over the visibilities
             f_sq = ((5 * 10 ** (-robust)) ** 2) / (
-                np.sum(cell_weight ** 2, axis=(1, 2)) / np.sum(self.weight, axis=1)
+                np.einsum("ijk,ijk->i", cell_weight, cell_weight)
+                / np.sum(cell_weight, axis=(1, 2))
             )
 
-            # the robust weight corresponding to the cell
-            cell_robust_weight = 1 / (1 + cell_weight * f_sq[:, np.newaxis, np.newaxis])
+            # the robust weight corresponding to the cell, 1 / (1 + W_k f^2)
+            # updated in place to avoid allocating additional cubes
+            cell_robust_weight = cell_weight * f_sq[:, np.newaxis, np.newaxis]
+            cell_robust_weight += 1
+            np.reciprocal(cell_robust_weight, out=cell_robust_weight)
 
             # zero out cells that have no visibilities
             # to prevent normalization error in next step
-            cell_robust_weight[~mask] = 0
+            cell_robust_weight[cell_weight == 0.0] = 0
+
+            return cell_robust_weight
+
+    def _calculate_vis_weight(
+        self,
+        cell_weight,
+        weighting="uniform",
+        robust=None,
+        taper_function=None,
+    ):
+        r"""
+        Calculate the product of the thermal, density, and (optionally) tapering weights for each of the loose visibilities.
 
-            # now assign the cell robust weight to each visibility within that cell
-            density_weight = self._extract_gridded_values_to_loose(cell_robust_weight)
+        Args:
+            cell_weight (np.array): ``(nchan, ncell_v, ncell_u)`` array of the summed thermal weights in each cell, in ground format, i.e., ``self._sum_cell_values_cube(self.weight)``.
+            weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2]. ``robust=-2`` approxmately corresponds to uniform weighting and ``robust=2`` approximately corresponds to natural weighting.
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. The function must assume that :math:`u` and :math:`v` will be supplied in units of :math:`\mathrm{k}\lambda`. The taper is evaluated at the :math:`u,v` of each input visibility, and the same value is applied to its complex conjugate. By default no taper is applied.
 
+        Returns:
+            A ``(nchan, nvis)`` array of the weight for each visibility. This has the same shape as the re, im samples.
+        """
+
+        cell_density_weight = self._calculate_cell_density_weight(
+            cell_weight, weighting=weighting, robust=robust
+        )
+
+        if cell_density_weight is None:
+            vis_weight = self.weight
         else:
-            raise ValueError(
-                "weighting must be specified as one of 'natural', 'uniform', or 'briggs'"
+            # assign the density weight of the cell to each visibility within that cell
+            # self.index_cell is (nchan, nvis)
+            # we want density weights to be (nchan, nvis)
+            vis_weight = self.weight * self._extract_gridded_values_to_loose(
+                cell_density_weight
             )
 
+        if taper_function is not None:
+            # evaluate the taper at the u,v of the original visibility for both it and
+            # its complex conjugate, so that the gridded visibilities stay Hermitian
+            # (and the image real) even if the taper isn't symmetric, i.e.,
+            # f(u,v) != f(-u,-v)
+            uu = np.where(self._conjugate, -self.uu, self.uu)
+            vv = np.where(self._conjugate, -self.vv, self.vv)
+            vis_weight = vis_weight * taper_function(uu, vv)
+
+        return vis_weight
+
+    def _grid_visibilities(
+        self,
+        weighting="uniform",
+        robust=None,
+        taper_function=None,
+        cell_sums=None,
+    ):
+        r"""
+        Grid the loose data visibilities to the Fourier grid in preparation for imaging.
+
+        Args:
+            weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2]. ``robust=-2`` approxmately corresponds to uniform weighting and ``robust=2`` approximately corresponds to natural weighting.
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. The function must assume that :math:`u` and :math:`v` will be supplied in units of :math:`\mathrm{k}\lambda`. By default no taper is applied.
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated. These sums don't depend on the weighting, so they can be reused between calls. By default they are calculated here.
+        """
+
+        # create the cells as edges around the existing points
+        # note that at this stage, the UV grid is strictly increasing
+        # when in fact, later on, we'll need to fftshift for the FFT
+        if cell_sums is None:
+            cell_sums = self._sum_weighted_cell_values()
+        cell_weight, cell_data_re, cell_data_im = cell_sums
+
+        # boolean index for cells that *contain* visibilities
+        mask = cell_weight > 0.0
+
+        if taper_function is None:
+            # the density weight is constant within each cell, so the weighted sums
+            # over the visibilities in a cell are the density weight of the cell times
+            # the sums of the thermally-weighted values, and there is no need to weight
+            # the loose visibilities individually
+            cell_density_weight = self._calculate_cell_density_weight(
+                cell_weight, weighting=weighting, robust=robust
+            )
+
+            if cell_density_weight is None:
+                data_re_gridded = cell_data_re
+                data_im_gridded = cell_data_im
+                re_gridded_beam = cell_weight
+            else:
+                data_re_gridded = cell_data_re * cell_density_weight
+                data_im_gridded = cell_data_im * cell_density_weight
+                re_gridded_beam = cell_weight * cell_density_weight
+
+        else:
+            # the taper varies within a cell, so weight each loose visibility
+            vis_weight = self._calculate_vis_weight(
+                cell_weight,
+                weighting=weighting,
+                robust=robust,
+                taper_function=taper_function,
+            )
+
+            # grid the reals and imaginaries separately
+            # outputs from _sum_cell_values_cube are *not* pre-packed
+            data_re_gridded = self._sum_cell_values_cube(self.data_re * vis_weight)
+
+            data_im_gridded = self._sum_cell_values_cube(self.data_im * vis_weight)
+
+            # the beam is the response to a point source, which is data_re = constant, data_im = 0
+            # so we save time and only calculate the reals, because gridded_beam_im = 0
+            re_gridded_beam = self._sum_cell_values_cube(vis_weight)
+
         # the factor of 2 in the denominator is needed because
         # we are approximating the Eqn 3.8 of Briggs' thesis
         # we need to sum over the Hermitian quantities in the
         # normalization constant.
-        self.C = 1 / np.sum(tapering_weight * density_weight * self.weight, axis=1)
-
-        # grid the reals and imaginaries separately
-        # outputs from _sum_cell_values_cube are *not* pre-packed
-        data_re_gridded = self._sum_cell_values_cube(
-            self.data_re * tapering_weight * density_weight * self.weight
-        )
-
-        data_im_gridded = self._sum_cell_values_cube(
-            self.data_im * tapering_weight * density_weight * self.weight
-        )
-
-        # the beam is the response to a point source, which is data_re = constant, data_im = 0
-        # so we save time and only calculate the reals, because gridded_beam_im = 0
-        re_gridded_beam = self._sum_cell_values_cube(
-            tapering_weight * density_weight * self.weight
-        )
+        # every visibility falls within a cell, so the sum of the visibility weights
+        # is the sum of the gridded beam
+        self.C = 1 / np.sum(re_gridded_beam, axis=(1, 2))
 
         # store the pre-packed FFT products for access by outside routines
         self.mask = np.fft.fftshift(mask)
@@ -304,7 +442,7 @@ class Gridder:
         # instantiate uncertainties for each averaged visibility.
         self.weight_gridded = np.fft.fftshift(cell_weight, axes=(1, 2))
 
-    def _estimate_cell_standard_deviation(self):
+    def _estimate_cell_standard_deviation(self, cell_sums=None):
         r"""
         Estimate the `standard deviation <https://en.wikipedia.org/wiki/Standard_deviation>`__ of the real and imaginary visibility values within each :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords`` using the following steps.
 
@@ -323,13 +461,16 @@ class Gridder:
             \bar{\sigma}_{i,j} = \frac{1}{N} \sum_k \sigma_k
 
 
+        Args:
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated.
+
         Returns:
             std_real, std_imag: two 3D arrays of size ``(nchan, npix, npix)`` in ground format containing the standard deviation of the real and imaginary values within each cell, in units of :math:`\sigma`. If everything is correctly calibrated, we expect :math:`s_{i,j} \approx 1 \forall i,j`.
 
         """
 
         # 1. use the gridding routine to calculate the mean real and imaginary values on the grid
-        self._grid_visibilities(weighting="uniform")
+        self._grid_visibilities(weighting="uniform", cell_sums=cell_sums)
 
         # convert grid back to ground format
         mu_re_gridded = np.fft.fftshift(self.data_re_gridded, axes=(1, 2))
@@ -377,18 +518,19 @@ class Gridder:
 
         return s_re, s_im
 
-    def _check_scatter_error(self, max_scatter=1.2):
+    def _check_scatter_error(self, max_scatter=1.2, cell_sums=None):
         """
         Checks/compares visibility scatter to a given threshold value ``max_scatter`` and raises an AssertionError if the median scatter across all cells exceeds ``max_scatter``.
 
         Args:
             max_scatter (float): the maximum permissible scatter in units of standard deviation.
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated.
 
         Returns:
             a dictionary containing keys ``return_status``, ``median_re``, and ``median_im``. ``return_status`` is a boolean that is ``False`` if scatter is within acceptable limits of max_scatter (good), and is ``True`` if scatter exceeds acceptable limits. ``median_re`` and ``median_im`` are the median scatter values returned across all cells, in units of standard deviation (estimated from the provided weights).
 
         """
-        s_re, s_im = self._estimate_cell_standard_deviation()
+        s_re, s_im = self._estimate_cell_standard_deviation(cell_sums=cell_sums)
 
         median_re = np.median(s_re[s_re > 0])
         median_im = np.median(s_im[s_im > 0])
@@ -404,13 +546,61 @@ class Gridder:
     def _fliplr_cube(self, cube):
         return cube[:, :, ::-1]
 
-    def _get_dirty_beam(self, C, re_gridded_beam):
+    def _irfft2_cube(self, C, cube, device=None):
+        r"""
+        Inverse FFT each channel of a packed cube of gridded visibilities, normalized by ``C``.
+
+        Because the gridded visibilities include their complex conjugates, they are Hermitian and the resulting image is real. This means that the transform only needs the half of the grid with :math:`u \ge 0` (the first ``npix//2 + 1`` columns of the packed cube), which halves the size of the FFT.
+
+        By default, uses the pocketfft backend of :func:`scipy.fft.irfft2`, which handles transform lengths with awkward prime factors via Bluestein's algorithm, so the transform stays :math:`\mathcal{O}(N \log N)` for any ``npix``. The channels are transformed in parallel across all available cores.
+
+        Args:
+            C (1D np.array): normalization constants for each channel
+            cube (3d np.array): an ``(nchan, npix, npix)`` packed cube of Hermitian gridded visibilities
+            device (torch.device): if not ``None``, carry out the transform with :func:`torch.fft.irfft2` on this device (e.g., ``"cuda"``) instead, and copy the result back to the host.
+
+        Returns:
+            The ``(nchan, npix, npix)`` real inverse FFT of ``C * cube`` *without* the :math:`1/N` normalization, i.e., ``npix**2 * numpy.fft.ifft2(C * cube).real``.
+        """
+        npix = self.coords.npix
+
+        # normalize the half grid into a new array, which the FFT can then overwrite
+        half_cube = np.multiply(
+            C[:, np.newaxis, np.newaxis],
+            cube[:, :, : npix // 2 + 1],
+            dtype=self._fft_dtype,
+        )
+
+        if device is not None:
+            return (
+                torch.fft.irfft2(
+                    torch.from_numpy(half_cube).to(device),
+                    s=(npix, npix),
+                    norm="forward",
+                )
+                .cpu()
+                .numpy()
+            )
+
+        # norm="forward" skips the 1/N scaling on the inverse transform,
+        # saving a separate pass (and temporary) to multiply it back out
+        return irfft2(
+            half_cube,
+            s=(npix, npix),
+            axes=(1, 2),
+            norm="forward",
+            workers=-1,
+            overwrite_x=True,
+        )
+
+    def _get_dirty_beam(self, C, re_gridded_beam, device=None):
         """
         Compute the dirty beam corresponding to the gridded visibilities.
 
         Args:
             C (1D np.array): normalization constants for each channel
             re_gridded_beam (3d np.array): the gridded visibilities corresponding to a unit point source in the center of the field.
+            device (torch.device): if not ``None``, the device on which to carry out the inverse FFT with PyTorch. By default, the FFT is done on the CPU with scipy.
 
         Returns:
             numpy image cube with a dirty beam (PSF) for each channel. By definition, the peak is normalized to 1.0.
@@ -420,23 +610,98 @@ class Gridder:
         # that is because we are using the FFT to compute an already discretized equation, not
         # approximating a continuous equation.
 
-        beam = self._fliplr_cube(
-            np.fft.fftshift(
-                self.coords.npix ** 2
-                * np.fft.ifft2(
-                    C[:, np.newaxis, np.newaxis] * re_gridded_beam,
-                ),
-                axes=(1, 2),
+        # for an even number of pixels, the flip and fftshift commute. Flipping first
+        # means that the copy made by fftshift leaves the beam C-contiguous
+        beam = np.fft.fftshift(
+            self._fliplr_cube(self._irfft2_cube(C, re_gridded_beam, device=device)),
+            axes=(1, 2),
+        )
+
+        self.beam = beam
+
+        return self.beam
+
+    def _get_dirty_image_nufft(
+        self,
+        weighting="uniform",
+        robust=None,
+        taper_function=None,
+        eps=1e-6,
+        cell_sums=None,
+    ):
+        r"""
+        Compute the dirty image and dirty beam directly from the loose visibilities with a type-1 non-uniform FFT, using the `finufft <https://finufft.readthedocs.io/>`__ package. Rather than averaging the visibilities to the grid and taking the FFT, this evaluates
+
+        .. math::
+
+            I(l,m) = C \sum_k w_k V_k \exp \left [2 \pi i (u_k l + v_k m) \right ]
+
+        at the image pixel centers to a relative precision of ``eps``, where :math:`w_k` are the weights from :func:`~mpol.gridding.Gridder._calculate_vis_weight` and :math:`C = 1 / \sum_k w_k`.
+
+        Args:
+            weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2].
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data.
+            eps (float): the requested relative precision of the NUFFT.
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated. Only the summed weights are needed here.
+
+        Returns:
+            2-tuple of (``image``, ``beam``) numpy image cubes of shape ``(nchan, npix, npix)``, with the image in units of Jy/beam.
+        """
+        try:
+            import finufft
+        except ImportError:
+            raise ImportError(
+                "backend='finufft' requires the finufft package, which can be installed with ``pip install finufft`` (or ``pip install MPoL[nufft]``)."
             )
+
+        if cell_sums is None:
+            cell_weight = self._sum_cell_values_cube(self.weight)
+        else:
+            cell_weight = cell_sums[0]
+        vis_weight = self._calculate_vis_weight(
+            cell_weight,
+            weighting=weighting,
+            robust=robust,
+            taper_function=taper_function,
         )
+        self.C = 1 / np.sum(vis_weight, axis=1)
 
-        assert (
-            np.max(beam.imag) < 1e-10
-        ), "Dirty beam contained substantial imaginary values, check input visibilities, otherwise raise a github issue."
+        # convert u, v [kλ] to the phase per image pixel [radians] expected by finufft
+        # the first output axis of the NUFFT corresponds to the first coordinate,
+        # so supply v first to get images stored as [m, l]
+        # the NUFFT is always done in double precision
+        phase_v = 2 * np.pi * 1e3 * self.coords.dm * self.vv.astype(np.float64)
+        phase_u = 2 * np.pi * 1e3 * self.coords.dl * self.uu.astype(np.float64)
 
-        self.beam = beam.real
+        npix = self.coords.npix
+        img = np.empty((self.nchan, npix, npix))
+        beam = np.empty((self.nchan, npix, npix))
 
-        return self.beam
+        for i in range(self.nchan):
+            # transform the weighted visibilities and the weights (a unit point source)
+            # together, since they share the same (u,v) points
+            c = np.stack(
+                [
+                    vis_weight[i] * (self.data_re[i] + 1.0j * self.data_im[i]),
+                    vis_weight[i].astype(np.complex128),
+                ]
+            )
+            # the output modes run from -npix/2 to npix/2 - 1
+            # i.e., ll, mm increasing with no fftshift
+            # flip them while copying into the (C-contiguous) image and beam cubes
+            img[i], beam[i] = self._fliplr_cube(
+                finufft.nufft2d1(
+                    phase_v[i], phase_u[i], c, (npix, npix), eps=eps, isign=1
+                ).real
+            )
+
+        img *= self.C[:, np.newaxis, np.newaxis]
+        beam *= self.C[:, np.newaxis, np.newaxis]
+
+        self.beam = beam
+
+        return img, self.beam
 
     def _null_dirty_beam(self, ntheta=24, single_channel_estimate=True):
         r"""Zero out (null) all pixels in the dirty beam exterior to the first null, for each channel.
@@ -520,6 +785,68 @@ class Gridder:
         )
         return self.coords.cell_size ** 2 * np.sum(nulled, axis=(1, 2))  # arcsec^2
 
+    def _warn_scatter_error(self, max_scatter=1.2, cell_sums=None):
+        r"""
+        Check the visibility scatter with :func:`~mpol.gridding.Gridder._check_scatter_error` and raise a ``RuntimeWarning`` if it exceeds ``max_scatter``.
+
+        Args:
+            max_scatter (float): the maximum allowable standard deviation of visibility values in a given :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords``. Defaults to a factor of 120%.
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated.
+        """
+        d = self._check_scatter_error(max_scatter, cell_sums=cell_sums)
+        if d["return_status"]:
+            warnings.warn(
+                RuntimeWarning(
+                    "Visibility scatter exceeds ``max_scatter``:{:}, indicating a potential problem with data weights. Consider inspecting weights using CASA tools before exporting visibilities for use with MPoL. Median real scatter: {:} x sigma. Median imag scatter: {:} x sigma.".format(
+                        max_scatter, d["median_re"], d["median_im"]
+                    )
+                )
+            )
+
+    def _get_dirty_image_fft(
+        self,
+        weighting="uniform",
+        robust=None,
+        taper_function=None,
+        device=None,
+        cell_sums=None,
+    ):
+        r"""
+        Average the visibilities to the grid with :func:`~mpol.gridding.Gridder._grid_visibilities` and inverse FFT them to calculate the dirty image and beam. Also stores the beam to ``self.beam``.
+
+        Args:
+            weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
+            robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2].
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. By default no taper is applied.
+            device (torch.device): if not ``None``, carry out the inverse FFTs with PyTorch on this device.
+            cell_sums (tuple): the output of :func:`~mpol.gridding.Gridder._sum_weighted_cell_values`, if it has already been calculated.
+
+        Returns:
+            2-tuple of (``image``, ``beam``) cubes, with the image in units of Jy/beam.
+        """
+
+        # inputs for weighting will be checked inside _grid_visibilities
+        self._grid_visibilities(
+            weighting=weighting,
+            robust=robust,
+            taper_function=taper_function,
+            cell_sums=cell_sums,
+        )
+
+        # flip before the fftshift so that the image is C-contiguous, as for the beam
+        img = np.fft.fftshift(
+            self._fliplr_cube(
+                self._irfft2_cube(self.C, self.vis_gridded, device=device)
+            ),
+            axes=(1, 2),
+        )  # Jy/beam
+
+        # calculate the beam
+        # also pre-stores internal self.beam value for area routine, if necessary
+        beam = self._get_dirty_beam(self.C, self.re_gridded_beam, device=device)
+
+        return img, beam
+
     def get_dirty_image(
         self,
         weighting="uniform",
@@ -528,59 +855,73 @@ class Gridder:
         unit="Jy/beam",
         check_visibility_scatter=True,
         max_scatter=1.2,
+        device=None,
+        backend="fft",
+        eps=1e-6,
         **beam_kwargs
     ):
         """
         Calculate the dirty image.
 
+        The gridded visibilities, normalization, and dirty beam of the most recent call are stored on the gridder, so calls on the same gridder should not be made concurrently from several threads. The FFTs themselves are already spread across all available cores.
+
         Args:
             weighting (string): The type of cell averaging to perform. Choices of ``"natural"``, ``"uniform"``, or ``"briggs"``, following CASA tclean. If ``"briggs"``, also specify a robust value.
             robust (float): If ``weighting='briggs'``, specify a robust value in the range [-2, 2]. ``robust=-2`` approxmately corresponds to uniform weighting and ``robust=2`` approximately corresponds to natural weighting.
-            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. The function must assume that :math:`u` and :math:`v` will be supplied in units of :math:`\mathrm{k}\lambda`. By default no taper is applied.
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data. The function must assume that :math:`u` and :math:`v` will be supplied in units of :math:`\mathrm{k}\lambda`. The taper is evaluated at the :math:`u,v` of each input visibility, and the same value is applied to its complex conjugate. By default no taper is applied.
             unit (string): what unit should the image be in. Default is ``"Jy/beam"``. If ``"Jy/arcsec^2"``, then the effective area of the dirty beam will be used to convert from ``"Jy/beam"`` to ``"Jy/arcsec^2"``.
             check_visibility_scatter (bool): whether the routine should check the standard deviation of visibilities in each within each :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords``. Default is ``True``. A ``RuntimeWarning`` will be raised if any cell has a scatter larger than ``max_scatter``.
             max_scatter (float): the maximum allowable standard deviation of visibility values in a given :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords``. Defaults to a factor of 120%.
+            device (torch.device): if not ``None``, carry out the inverse FFTs with PyTorch on this device (e.g., ``"cuda"`` if ``torch.cuda.is_available()``). By default, the FFTs are done on the CPU with scipy.
+            backend (string): how to compute the dirty image. The default ``"fft"`` averages the visibilities to the grid defined by ``self.coords`` and uses the FFT, as in CASA. ``"finufft"`` evaluates the dirty image directly from the loose visibilities using a type-1 non-uniform FFT on the CPU (so ``device`` must be ``None``), which requires the optional `finufft <https://finufft.readthedocs.io/>`__ package (``pip install MPoL[nufft]``).
+            eps (float): if ``backend="finufft"``, the requested relative precision of the non-uniform FFT.
             **beam_kwargs: all additional keyword arguments passed to :func:`~mpol.gridding.get_dirty_beam_area` if ``unit="Jy/arcsec^2"``.
 
         Returns:
-            2-tuple of (``image``, ``beam``) where ``image`` is an (nchan, npix, npix) numpy array of the dirty image cube in units ``unit``. ``beam`` is an numpy image cube with a dirty beam (PSF) for each channel. The units of the beam are always Jy/{dirty beam}, i.e., the peak of the beam is normalized to 1.0.
+            2-tuple of (``image``, ``beam``) where ``image`` is an (nchan, npix, npix) numpy array of the dirty image cube in units ``unit``. ``beam`` is an numpy image cube with a dirty beam (PSF) for each channel. The units of the beam are always Jy/{dirty beam}, i.e., the peak of the beam is normalized to 1.0. If ``backend="fft"``, the image and beam have the same floating point precision as ``data_re`` and ``data_im``.
         """
 
         # check unit input
         if unit not in ["Jy/beam", "Jy/arcsec^2"]:
             raise ValueError("Unknown unit", unit)
 
-        # check the visibility scatter and flag user if there are issues
-        if check_visibility_scatter:
-            d = self._check_scatter_error(max_scatter)
-            if d["return_status"]:
-                warnings.warn(
-                    RuntimeWarning(
-                        "Visibility scatter exceeds ``max_scatter``:{:}, indicating a potential problem with data weights. Consider inspecting weights using CASA tools before exporting visibilities for use with MPoL. Median real scatter: {:} x sigma. Median imag scatter: {:} x sigma.".format(
-                            max_scatter, d["median_re"], d["median_im"]
-                        )
-                    )
-                )
-
-        # call _grid_visibilities
-        # inputs for weighting will be checked inside _grid_visibilities
-        self._grid_visibilities(
-            weighting=weighting,
-            robust=robust,
-            taper_function=taper_function,
-        )
+        # check backend input before doing any work
+        if backend not in ["fft", "finufft"]:
+            raise ValueError("backend must be one of 'fft' or 'finufft'", backend)
 
-        img = self._fliplr_cube(
-            np.fft.fftshift(
-                self.coords.npix ** 2
-                * np.fft.ifft2(self.C[:, np.newaxis, np.newaxis] * self.vis_gridded),
-                axes=(1, 2),
+        if backend == "finufft" and device is not None:
+            raise ValueError(
+                "device is only supported with backend='fft', the finufft backend always runs on the CPU",
+                device,
             )
-        )  # Jy/beam
 
-        # calculate the beam
-        # also pre-stores internal self.beam value for area routine, if necessary
-        beam = self._get_dirty_beam(self.C, self.re_gridded_beam)
+        self._check_weighting(weighting, robust)
+
+        # check the visibility scatter and flag user if there are issues
+        # the cell sums it needs are reused to image the visibilities
+        cell_sums = None
+        if check_visibility_scatter:
+            cell_sums = self._sum_weighted_cell_values()
+            self._warn_scatter_error(max_scatter, cell_sums=cell_sums)
+
+        if backend == "fft":
+            img, beam = self._get_dirty_image_fft(
+                weighting=weighting,
+                robust=robust,
+                taper_function=taper_function,
+                device=device,
+                cell_sums=cell_sums,
+            )  # Jy/beam
+
+        else:
+            # also pre-stores internal self.beam value for area routine, if necessary
+            img, beam = self._get_dirty_image_nufft(
+                weighting=weighting,
+                robust=robust,
+                taper_function=taper_function,
+                eps=eps,
+                cell_sums=cell_sums,
+            )  # Jy/beam
 
         # for units of Jy/arcsec^2, we could just leave out the C constant *if* we were doing
         # uniform weighting. The relationships get more complex for robust or natural weighting, however,
@@ -594,11 +935,67 @@ class Gridder:
 
             img /= beam_area_per_chan[:, np.newaxis, np.newaxis]
 
-        assert (
-            np.max(img.imag) < 1e-10
-        ), "Dirty image contained substantial imaginary values, check input visibilities, otherwise raise a github issue."
+        return img, beam
+
+    def get_dirty_images(
+        self,
+        weightings,
+        taper_function=None,
+        unit="Jy/beam",
+        check_visibility_scatter=True,
+        max_scatter=1.2,
+        device=None,
+        **beam_kwargs
+    ):
+        r"""
+        Calculate the dirty images for several choices of weighting at once. This gives the same images as calling :func:`~mpol.gridding.Gridder.get_dirty_image` for each weighting, but the work that doesn't depend on the weighting (checking the visibility scatter and summing the thermally-weighted visibilities within each cell) is only done once, leaving only the density weighting and the inverse FFTs to be done for each weighting.
+
+        Args:
+            weightings (list): list of ``(weighting, robust)`` 2-tuples, one for each dirty image, e.g., ``[("uniform", None), ("natural", None), ("briggs", 0.0)]``. See :func:`~mpol.gridding.Gridder.get_dirty_image` for the choices of ``weighting`` and ``robust``.
+            taper_function (function reference): a function assumed to be of the form :math:`f(u,v)` which calculates a prefactor in the range :math:`[0,1]` and premultiplies the visibility data, applied to all of the images. By default no taper is applied.
+            unit (string): what unit should the images be in. Default is ``"Jy/beam"``. If ``"Jy/arcsec^2"``, then the effective area of each dirty beam will be used to convert from ``"Jy/beam"`` to ``"Jy/arcsec^2"``.
+            check_visibility_scatter (bool): whether the routine should check the standard deviation of visibilities in each within each :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords``. Default is ``True``. A ``RuntimeWarning`` will be raised if any cell has a scatter larger than ``max_scatter``.
+            max_scatter (float): the maximum allowable standard deviation of visibility values in a given :math:`u,v` cell (:math:`\mathrm{cell}_{i,j}`) defined by ``self.coords``. Defaults to a factor of 120%.
+            device (torch.device): if not ``None``, carry out the inverse FFTs with PyTorch on this device (e.g., ``"cuda"`` if ``torch.cuda.is_available()``). By default, the FFTs are done on the CPU with scipy.
+            **beam_kwargs: all additional keyword arguments passed to :func:`~mpol.gridding.get_dirty_beam_area` if ``unit="Jy/arcsec^2"``.
+
+        Returns:
+            list of (``image``, ``beam``) 2-tuples, one for each entry in ``weightings``, as returned by :func:`~mpol.gridding.Gridder.get_dirty_image`. Afterwards, the gridded products stored on the gridder (e.g., ``self.beam``) correspond to the last weighting.
+        """
+
+        # check unit input
+        if unit not in ["Jy/beam", "Jy/arcsec^2"]:
+            raise ValueError("Unknown unit", unit)
+
+        # check all of the weightings before doing any work
+        for weighting, robust in weightings:
+            self._check_weighting(weighting, robust)
+
+        # the thermally-weighted cell sums are the same for every weighting
+        # (and are also used to check the scatter)
+        cell_sums = self._sum_weighted_cell_values()
+
+        # check the visibility scatter and flag user if there are issues
+        if check_visibility_scatter:
+            self._warn_scatter_error(max_scatter, cell_sums=cell_sums)
+
+        dirty_images = []
+        for weighting, robust in weightings:
+            img, beam = self._get_dirty_image_fft(
+                weighting=weighting,
+                robust=robust,
+                taper_function=taper_function,
+                device=device,
+                cell_sums=cell_sums,
+            )  # Jy/beam
+
+            if unit == "Jy/arcsec^2":
+                beam_area_per_chan = self.get_dirty_beam_area(**beam_kwargs)
+                img /= beam_area_per_chan[:, np.newaxis, np.newaxis]
+
+            dirty_images.append((img, beam))
 
-        return img.real, beam
+        return dirty_images
 
     def to_pytorch_dataset(self, check_visibility_scatter=True, max_scatter=1.2):
         """
@@ -1,3 +1,7 @@
+import copy
+import hashlib
+import os
+
 import numpy as np
 import pytest
 from astropy.utils.data import download_file
@@ -7,54 +11,108 @@ from mpol import coordinates, gridding
 # We need a fixture which provides mock visibilities of the sort we'd
 # expect from visread, but *without* the CASA dependency.
 
-# fixture to provide tuple of uu, vv, weight, data_re, and data_im values
-@pytest.fixture(scope="session")
-def mock_visibility_archive():
+MOCK_URL = "https://zenodo.org/record/4930016/files/logo_cube.noise.npz"
+
+# single precision is plenty for the tests, and halves the memory traffic
+MOCK_DTYPE = np.float32
 
+
+def _load_mock_archive():
     # use astropy routines to cache data
-    fname = download_file(
-        "https://zenodo.org/record/4930016/files/logo_cube.noise.npz",
-        cache=True,
-        pkgname="mpol",
-    )
+    fname = download_file(MOCK_URL, cache=True, pkgname="mpol")
 
-    return np.load(fname)
+    with np.load(fname, allow_pickle=False) as d:
+        data = d["data"]
+        return {
+            "uu": d["uu"].astype(MOCK_DTYPE, copy=False),
+            "vv": d["vv"].astype(MOCK_DTYPE, copy=False),
+            "weight": d["weight"].astype(MOCK_DTYPE, copy=False),
+            "data_re": np.real(data).astype(MOCK_DTYPE),
+            "data_im": np.imag(data).astype(MOCK_DTYPE),  # CASA convention
+        }
 
 
-@pytest.fixture
+# fixture to provide a dict of uu, vv, weight, data_re, and data_im arrays
+@pytest.fixture(scope="session")
+def mock_visibility_archive(request):
+
+    # the npz archive is compressed, so reading it means inflating every array.
+    # Do this once, and keep uncompressed copies of the arrays in the pytest cache,
+    # which later sessions (and parallel test processes) can memory-map instead.
+    # Run pytest with --cache-clear to rebuild them
+    cache = getattr(request.config, "cache", None)
+
+    if cache is None:
+        # the cacheprovider plugin is disabled (-p no:cacheprovider), so just load
+        # the arrays into memory. They are shared by every test in the session, so
+        # make them read-only to guard against a test modifying them in place
+        archive = _load_mock_archive()
+        for value in archive.values():
+            value.flags.writeable = False
+        return archive
+
+    # key the cache directory on the source and dtype of the arrays, so that
+    # changing either one doesn't pick up stale copies
+    key = hashlib.sha1(
+        "{:}:{:}".format(MOCK_URL, np.dtype(MOCK_DTYPE).str).encode()
+    ).hexdigest()[:16]
+    cache_dir = cache.mkdir("mpol_mock_visibilities_{:}".format(key))
+    paths = {
+        name: cache_dir / "{:}.npy".format(name)
+        for name in ["uu", "vv", "weight", "data_re", "data_im"]
+    }
+
+    if not all(path.exists() for path in paths.values()):
+        archive = _load_mock_archive()
+
+        # write each array to a temporary file and then move it into place, so that
+        # a concurrent test process never reads a partially written file
+        for name, path in paths.items():
+            tmp_path = path.with_name("{:}.{:}.tmp".format(path.name, os.getpid()))
+            with open(tmp_path, "wb") as f:
+                np.save(f, archive[name])
+            os.replace(tmp_path, path)
+
+    # the arrays are shared by every test in the session, so map them read-only to
+    # guard against a test accidentally modifying them in place
+    return {name: np.load(path, mmap_mode="r") for name, path in paths.items()}
+
+
+@pytest.fixture(scope="session")
 def mock_visibility_data(mock_visibility_archive):
     d = mock_visibility_archive
     uu = d["uu"]
     vv = d["vv"]
     weight = d["weight"]
-    data = d["data"]
-    data_re = np.real(data)
-    data_im = np.imag(data)  # CASA convention
+    data_re = d["data_re"]
+    data_im = d["data_im"]
 
     return uu, vv, weight, data_re, data_im
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_visibility_data_cont(mock_visibility_archive):
     chan = 4
     d = mock_visibility_archive
+    # indexing a single channel returns a view, not a copy
     uu = d["uu"][chan]
     vv = d["vv"][chan]
     weight = d["weight"][chan]
-    data = d["data"][chan]
-    data_re = np.real(data)
-    data_im = np.imag(data)  # CASA convention
+    data_re = d["data_re"][chan]
+    data_im = d["data_im"][chan]
 
     return uu, vv, weight, data_re, data_im
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coords():
     return coordinates.GridCoords(cell_size=0.005, npix=800)
 
 
-@pytest.fixture
-def dataset(mock_visibility_data, coords):
+# gridding the visibilities is the most expensive setup step, so only do it
+# once per session for each dataset
+@pytest.fixture(scope="session")
+def dataset_session(mock_visibility_data, coords):
     uu, vv, weight, data_re, data_im = mock_visibility_data
 
     gridder = gridding.Gridder(
@@ -69,8 +127,8 @@ def dataset(mock_visibility_data, coords):
     return gridder.to_pytorch_dataset()
 
 
-@pytest.fixture
-def dataset_cont(mock_visibility_data_cont, coords):
+@pytest.fixture(scope="session")
+def dataset_cont_session(mock_visibility_data_cont, coords):
 
     uu, vv, weight, data_re, data_im = mock_visibility_data_cont
     gridder = gridding.Gridder(
@@ -85,6 +143,18 @@ def dataset_cont(mock_visibility_data_cont, coords):
     return gridder.to_pytorch_dataset()
 
 
+# some tests modify the dataset in place (e.g., with add_mask),
+# so give each test its own copy of the session dataset
+@pytest.fixture
+def dataset(dataset_session):
+    return copy.deepcopy(dataset_session)
+
+
+@pytest.fixture
+def dataset_cont(dataset_cont_session):
+    return copy.deepcopy(dataset_cont_session)
+
+
 @pytest.fixture
 def crossvalidation_products(mock_visibility_data):
     # test the crossvalidation with a smaller set of coordinates than normal,
@@ -17,6 +17,17 @@ def test_grid_coords_equal():
     assert coords1 == coords2
 
 
+# the 2D coordinate arrays should only be calculated when first accessed
+def test_grid_coords_lazy_2D():
+    coords = coordinates.GridCoords(cell_size=0.01, npix=512)
+    assert "packed_q_centers_2D" not in vars(coords)
+
+    q_centers_2D = coords.packed_q_centers_2D
+    assert q_centers_2D.shape == (512, 512)
+    assert coords.packed_q_centers_2D is q_centers_2D
+    assert coords.q_max == np.max(q_centers_2D) + np.sqrt(2) * coords.du
+
+
 def test_grid_coords_unequal_pix():
     coords1 = coordinates.GridCoords(cell_size=0.01, npix=510)
     coords2 = coordinates.GridCoords(cell_size=0.01, npix=512)
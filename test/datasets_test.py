@@ -16,6 +16,16 @@ def test_dataset_device(dataset):
         pass
 
 
+def test_dataset_pinned_device(dataset):
+    if torch.cuda.is_available():
+        dataset = dataset.pin_memory()
+        assert dataset.vis_gridded.is_pinned()
+        dataset = dataset.to("cuda", non_blocking=True)
+        dataset = dataset.to("cpu")
+    else:
+        pass
+
+
 def test_mask_dataset(dataset):
     updated_mask = np.ones_like(dataset.coords.packed_u_centers_2D)
     dataset.add_mask(updated_mask)
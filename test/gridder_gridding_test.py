@@ -27,6 +27,54 @@ def test_grid_cont(mock_visibility_data_cont):
     gridder._grid_visibilities(weighting="uniform")
 
 
+# the cell sums should match a direct 2D histogram of the loose visibilities
+def test_sum_cell_values_histogram(mock_visibility_data):
+    uu, vv, weight, data_re, data_im = mock_visibility_data
+
+    gridder = gridding.Gridder(
+        cell_size=0.005,
+        npix=800,
+        uu=uu,
+        vv=vv,
+        weight=weight,
+        data_re=data_re,
+        data_im=data_im,
+    )
+
+    cube = gridder._sum_cell_values_cube(gridder.weight)
+
+    for i in range(gridder.nchan):
+        H, _, _ = np.histogram2d(
+            gridder.vv[i],
+            gridder.uu[i],
+            bins=[gridder.coords.v_edges, gridder.coords.u_edges],
+            weights=gridder.weight[i],
+        )
+        assert np.allclose(cube[i], H)
+
+
+# the cell indices of the complex conjugates should match digitizing -u, -v directly
+def test_conjugate_cell_indices(mock_visibility_data):
+    uu, vv, weight, data_re, data_im = mock_visibility_data
+
+    gridder = gridding.Gridder(
+        cell_size=0.005,
+        npix=800,
+        uu=uu,
+        vv=vv,
+        weight=weight,
+        data_re=data_re,
+        data_im=data_im,
+    )
+
+    assert np.array_equal(
+        gridder.index_u, np.digitize(gridder.uu, gridder.coords.u_edges) - 1
+    )
+    assert np.array_equal(
+        gridder.index_v, np.digitize(gridder.vv, gridder.coords.v_edges) - 1
+    )
+
+
 # test that we're getting the right numbers back for some well defined operations
 def test_uniform_ones(mock_visibility_data, tmp_path):
     coords = coordinates.GridCoords(cell_size=0.005, npix=800)
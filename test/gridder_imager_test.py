@@ -4,6 +4,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+import torch
 
 from mpol import coordinates, gridding
 from mpol.constants import *
@@ -293,6 +294,167 @@ def test_grid_natural_arcsec2(gridder, tmp_path):
     plt.close("all")
 
 
+# a taper that isn't symmetric, f(u,v) != f(-u,-v), should still give a Hermitian
+# grid, so the (half-grid) dirty image should match a full complex inverse FFT
+def test_dirty_image_asymmetric_taper(gridder):
+    img, beam = gridder.get_dirty_image(
+        weighting="briggs",
+        robust=0.0,
+        taper_function=lambda uu, vv: 1 / (1 + np.exp(-uu / 100)),
+        check_visibility_scatter=False,
+    )
+
+    full = np.fft.ifft2(
+        gridder.C[:, np.newaxis, np.newaxis] * gridder.vis_gridded, norm="forward"
+    )
+    assert np.max(np.abs(full.imag)) < 1e-6 * np.max(np.abs(full.real))
+
+    img_full = np.fft.fftshift(full.real, axes=(1, 2))[:, :, ::-1]
+    assert np.allclose(img, img_full, atol=1e-5 * np.max(np.abs(img)))
+
+
+# the dirty image and beam should be returned as C-contiguous cubes
+def test_dirty_image_contiguous(gridder):
+    img, beam = gridder.get_dirty_image(
+        weighting="briggs", robust=0.0, check_visibility_scatter=False
+    )
+
+    npix = gridder.coords.npix
+    assert img.shape == (gridder.nchan, npix, npix)
+    assert img.flags.c_contiguous
+    assert beam.flags.c_contiguous
+
+
+# the PyTorch FFT path should match the default scipy FFT
+def test_dirty_image_device(gridder):
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    img, beam = gridder.get_dirty_image(
+        weighting="briggs", robust=0.0, check_visibility_scatter=False
+    )
+    img_device, beam_device = gridder.get_dirty_image(
+        weighting="briggs", robust=0.0, check_visibility_scatter=False, device=device
+    )
+
+    # compare relative to the peak, since the mock data are single precision
+    assert np.allclose(img, img_device, atol=1e-5 * np.max(np.abs(img)))
+    assert np.allclose(beam, beam_device, atol=1e-5)
+
+
+# the NUFFT dirty image skips the averaging to the grid, so it should only
+# approximately match the gridded dirty image
+def test_dirty_image_finufft(gridder):
+    pytest.importorskip("finufft")
+
+    img, beam = gridder.get_dirty_image(
+        weighting="briggs", robust=0.0, check_visibility_scatter=False
+    )
+    img_nufft, beam_nufft = gridder.get_dirty_image(
+        weighting="briggs",
+        robust=0.0,
+        check_visibility_scatter=False,
+        backend="finufft",
+    )
+
+    assert img_nufft.shape == img.shape
+    assert img_nufft.flags.c_contiguous
+    assert beam_nufft.flags.c_contiguous
+    for i in range(gridder.nchan):
+        assert np.max(beam_nufft[i]) == pytest.approx(1.0, rel=1e-4)
+
+    assert np.all(np.abs(beam - beam_nufft) < 0.1)
+
+
+# the beam is symmetric, so also check that the NUFFT image of a point source offset
+# from the phase center peaks at the same pixel as the FFT image
+def test_dirty_image_finufft_offset(mock_visibility_data):
+    pytest.importorskip("finufft")
+
+    uu, vv, weight, data_re, data_im = mock_visibility_data
+
+    # a point source 0.3 arcsec east and 0.15 arcsec north of the phase center
+    l0 = 0.3 * arcsec
+    m0 = 0.15 * arcsec
+    phase = 2 * np.pi * 1e3 * (uu * l0 + vv * m0)
+
+    gridder = gridding.Gridder(
+        cell_size=0.005,
+        npix=800,
+        uu=uu,
+        vv=vv,
+        weight=weight,
+        data_re=np.cos(phase),
+        data_im=-np.sin(phase),
+    )
+
+    img, beam = gridder.get_dirty_image(
+        weighting="uniform", check_visibility_scatter=False
+    )
+    img_nufft, beam_nufft = gridder.get_dirty_image(
+        weighting="uniform", check_visibility_scatter=False, backend="finufft"
+    )
+
+    for i in range(gridder.nchan):
+        assert np.argmax(img_nufft[i]) == np.argmax(img[i])
+
+
+# bad backend arguments should be caught before the (slow) scatter check
+@pytest.mark.parametrize(
+    "backend, device",
+    [("fftw", None), ("finufft", "cpu")],
+)
+def test_dirty_image_backend_fail(gridder, backend, device):
+    with pytest.raises(ValueError):
+        gridder.get_dirty_image(weighting="uniform", backend=backend, device=device)
+
+
+# without a taper, the visibilities are weighted per cell rather than individually.
+# A taper of ones goes through the per-visibility weighting, and should agree
+@pytest.mark.parametrize(
+    "weighting, robust", [("natural", None), ("uniform", None), ("briggs", 0.5)]
+)
+def test_dirty_image_cell_weighting(gridder, weighting, robust):
+    img, beam = gridder.get_dirty_image(
+        weighting=weighting, robust=robust, check_visibility_scatter=False
+    )
+    img_taper, beam_taper = gridder.get_dirty_image(
+        weighting=weighting,
+        robust=robust,
+        taper_function=lambda uu, vv: np.ones_like(uu),
+        check_visibility_scatter=False,
+    )
+
+    assert np.allclose(img, img_taper, atol=1e-5 * np.max(np.abs(img)))
+    assert np.allclose(beam, beam_taper, atol=1e-5)
+
+
+# the stacked routine should match imaging each weighting separately
+def test_dirty_images(gridder):
+    weightings = [("uniform", None), ("natural", None), ("briggs", 0.0)]
+
+    dirty_images = gridder.get_dirty_images(
+        weightings, unit="Jy/arcsec^2", check_visibility_scatter=False
+    )
+
+    assert len(dirty_images) == len(weightings)
+    for (weighting, robust), (img, beam) in zip(weightings, dirty_images):
+        img_single, beam_single = gridder.get_dirty_image(
+            weighting=weighting,
+            robust=robust,
+            unit="Jy/arcsec^2",
+            check_visibility_scatter=False,
+        )
+
+        assert np.array_equal(img, img_single)
+        assert np.array_equal(beam, beam_single)
+
+
+# a bad weighting anywhere in the list should fail before any images are made
+def test_dirty_images_weighting_fail(gridder):
+    with pytest.raises(ValueError):
+        gridder.get_dirty_images([("uniform", None), ("briggs", None)])
+
+
 def test_cell_variance_warning_image(mock_visibility_data):
     coords = coordinates.GridCoords(cell_size=0.01, npix=400)
 